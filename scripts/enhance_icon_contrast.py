@@ -1,42 +1,122 @@
 
 import os
-from PIL import Image, ImageEnhance, ImageFilter
+import hashlib
+import tempfile
+import multiprocessing
+import numpy as np
+from PIL import Image, ImageEnhance, ImageFilter, ImageStat
+
+# Decoded icons are cached so the next script can skip PNG decoding.
+# Kept outside the icons folder so the cache never ends up in the build.
+CACHE_DIR = os.path.join(tempfile.gettempdir(), "gorewrite_icon_cache")
+
+def cache_path(path):
+    key = hashlib.sha1(os.path.abspath(path).encode("utf-8")).hexdigest()
+    return os.path.join(CACHE_DIR, f"{key}.npz")
+
+def png_stamp(path):
+    # Exact mtime and size of the PNG the cache was made from. A newer-than
+    # check is not enough: copies (Explorer, Copy-Item, shutil.copy2) keep
+    # the original, older mtime.
+    st = os.stat(path)
+    return np.array([st.st_mtime_ns, st.st_size], dtype=np.int64)
+
+def write_cache(path, arr):
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    np.savez(cache_path(path), rgba=arr, stamp=png_stamp(path))
+
+def load_rgba(path):
+    cache = cache_path(path)
+    if os.path.exists(cache):
+        with np.load(cache) as cached:
+            if np.array_equal(cached["stamp"], png_stamp(path)):
+                return cached["rgba"]
+    arr = np.array(Image.open(path).convert("RGBA"))
+    write_cache(path, arr)
+    return arr
+
+def save_rgba(path, arr):
+    Image.fromarray(arr).save(path)
+    # Stamped with the PNG just written
+    write_cache(path, arr)
+
+def otsu_threshold(histogram):
+    # Otsu's method: pick the split that maximizes between-class variance.
+    # Values below the returned threshold form the dark class.
+    hist = np.asarray(histogram, dtype=np.float64)
+    levels = np.arange(hist.size)
+    
+    w0 = hist.cumsum()
+    w1 = w0[-1] - w0
+    m0 = (hist * levels).cumsum()
+    m1 = m0[-1] - m0
+    
+    with np.errstate(divide="ignore", invalid="ignore"):
+        variance = w0 * w1 * (m0 / w0 - m1 / w1) ** 2
+    variance = np.nan_to_num(variance)
+    
+    return int(np.argmax(variance)) + 1
+
+def contrast_lut(img, factor):
+    # Stretch color bands around the mean gray level, leave alpha untouched
+    mean = int(ImageStat.Stat(img.convert("L")).mean[0] + 0.5)
+    lut = np.clip(mean + (np.arange(256) - mean) * factor, 0, 255).astype(np.uint8).tolist()
+    identity = list(range(256))
+    return [v for band in img.getbands() for v in (identity if band == "A" else lut)]
+
+def is_quantized(img):
+    # Icons with only a handful of distinct values are already black/white
+    return np.unique(np.asarray(img)).size < 8
+
+def enhance_contrast_array(arr):
+    # Works on an RGBA uint8 array so a pipeline can chain stages in memory.
+    # Already quantized icons are returned as is (the same array object).
+    if is_quantized(arr):
+        return arr
+    img = Image.fromarray(arr)
+    
+    # 1. Enhance Contrast & Sharpness
+    # Make the darks darker and lights lighter to survive downscaling
+    # Same as ImageEnhance.Contrast(img).enhance(2.0), but as a lookup
+    # table applied in one pass instead of blending with a gray image
+    img = img.point(contrast_lut(img, 2.0))  # Increase contrast significantly
+    
+    sharpener = ImageEnhance.Sharpness(img)
+    img = sharpener.enhance(2.0) # Sharpen edges
+    
+    # 2. Ensure lines are BLACK not gray
+    # Split visible pixels into dark (grid lines, black stones) and light
+    # (white stones) with an Otsu threshold on their brightness
+    arr = np.array(img)
+    gray = np.array(img.convert("L"))
+    visible = arr[..., 3] > 0
+    hist = np.bincount(gray[visible], minlength=256)
+    threshold = otsu_threshold(hist)
+    
+    # Only pixels brighter than the light class's mean count as white stone;
+    # the band in between is left alone to keep the anti-aliasing
+    light_hist = hist[threshold:]
+    if light_hist.sum():
+        upper = (light_hist * np.arange(threshold, 256)).sum() / light_hist.sum()
+    else:
+        upper = 255
+    
+    # Dark pixels become full black, light pixels pure white
+    dark = visible & (gray < threshold)
+    light = visible & (gray > upper)
+    arr[dark] = (0, 0, 0, 255)
+    arr[light] = (255, 255, 255, 255)
+    return arr
 
 def enhance_contrast(image_path):
     try:
-        img = Image.open(image_path).convert("RGBA")
-        
-        # 1. Enhance Contrast & Sharpness
-        # Make the darks darker and lights lighter to survive downscaling
-        enhancer = ImageEnhance.Contrast(img)
-        img = enhancer.enhance(2.0)  # Increase contrast significantly
-        
-        sharpener = ImageEnhance.Sharpness(img)
-        img = sharpener.enhance(2.0) # Sharpen edges
+        arr = load_rgba(image_path)
+        enhanced = enhance_contrast_array(arr)
+        if enhanced is arr:
+            print(f"Already quantized, skipped: {image_path}")
+            return
         
-        # 2. Ensure lines are BLACK not gray
-        # Convert to grayscale to check brightness, then force dark pixels to black
-        # This is a pixel-level operation for precision
-        pixels = img.load()
-        width, height = img.size
-        
-        for y in range(height):
-            for x in range(width):
-                r, g, b, a = pixels[x, y]
-                # If pixel is visible
-                if a > 0:
-                    # If it's a grid line (dark gray), make it black
-                    # Grid lines are usually R=G=B and low value relative to white
-                    if r < 150 and g < 150 and b < 150:
-                        # But preserve the difference between "Black Stone" and "Line" if needed?
-                        # Actually both should be black for max visibility against white bg
-                        pixels[x, y] = (0, 0, 0, 255) # Force full black, full opacity
-                    
-                    # If it's white stone (high value), ensure it's pure white
-                    elif r > 200 and g > 200 and b > 200:
-                        pixels[x, y] = (255, 255, 255, 255)
-
-        img.save(image_path)
+        save_rgba(image_path, enhanced)
         print(f"Enhanced contrast for: {image_path}")
         
     except Exception as e:
@@ -47,9 +127,15 @@ if __name__ == "__main__":
     # Process all icon sizes
     targets = ["icon16.png", "icon48.png", "icon128.png"]
     
+    paths = []
     for filename in targets:
         path = os.path.join(target_dir, filename)
         if os.path.exists(path):
-            enhance_contrast(path)
+            paths.append(path)
         else:
             print(f"Not found: {path}")
+    
+    # Each icon is independent, so process them in parallel
+    if paths:
+        with multiprocessing.Pool(len(paths)) as pool:
+            pool.map(enhance_contrast, paths)
@@ -1,42 +1,58 @@
+# The Lanczos downsample dominates the run time. Pillow-SIMD is a drop-in
+# replacement with a SIMD (SSE4/AVX2) resize and the same API:
+#   pip uninstall pillow && pip install pillow-simd
+
 import os
-from PIL import Image, ImageEnhance, ImageFilter
+import multiprocessing
+from PIL import Image, ImageFilter
+from enhance_icon_contrast import contrast_lut
 
 # Configuration
 SOURCE_PATH = "/home/mimura/.gemini/antigravity/brain/2c069eec-8ad4-4b69-bfa0-90a5395e1ec3/uploaded_image_1766725838378.png"
 DEST_DIR = "/home/mimura/projects/GORewrite/public/icons"
 SIZES = [128, 48, 16]
 
+def generate_icon(img, size):
+    try:
+        # Use Lanczos filter for high quality downsampling
+        resized_img = img.resize((size, size), Image.Resampling.LANCZOS)
+        
+        # Apply sharpening for small sizes to prevent blurriness
+        if size <= 48:
+            # Boost contrast slightly, as a one-pass lookup table
+            # (same result as ImageEnhance.Contrast)
+            if resized_img.mode not in ("L", "LA", "RGB", "RGBA"):
+                resized_img = resized_img.convert("RGBA")
+            resized_img = resized_img.point(contrast_lut(resized_img, 1.2)) # 20% more contrast
+            
+            # Apply sharpening
+            # Repeat sharpening for very small 16px
+            resized_img = resized_img.filter(ImageFilter.UnsharpMask(radius=1, percent=150, threshold=3))
+        
+        dest_path = os.path.join(DEST_DIR, f"icon{size}.png")
+        resized_img.save(dest_path, "PNG")
+        print(f"Generated {dest_path} ({size}x{size}) with sharpening")
+
+    except Exception as e:
+        print(f"An error occurred: {e}")
+
 def generate_icons():
     if not os.path.exists(SOURCE_PATH):
         print(f"Error: Source file not found at {SOURCE_PATH}")
         return
 
     try:
-        # Open the source image
+        # Open and decode the source image once; workers get the decoded pixels
         with Image.open(SOURCE_PATH) as img:
+            img.load()
             print(f"Loaded source image: {img.size} mode={img.mode}")
 
             # Ensure destination directory exists
             os.makedirs(DEST_DIR, exist_ok=True)
 
-            # Generate each size
-            for size in SIZES:
-                # Use Lanczos filter for high quality downsampling
-                resized_img = img.resize((size, size), Image.Resampling.LANCZOS)
-                
-                # Apply sharpening for small sizes to prevent blurriness
-                if size <= 48:
-                    # Boost contrast slightly
-                    enhancer = ImageEnhance.Contrast(resized_img)
-                    resized_img = enhancer.enhance(1.2) # 20% more contrast
-                    
-                    # Apply sharpening
-                    # Repeat sharpening for very small 16px
-                    resized_img = resized_img.filter(ImageFilter.UnsharpMask(radius=1, percent=150, threshold=3))
-                
-                dest_path = os.path.join(DEST_DIR, f"icon{size}.png")
-                resized_img.save(dest_path, "PNG")
-                print(f"Generated {dest_path} ({size}x{size}) with sharpening")
+            # Each size is independent, so generate them in parallel
+            with multiprocessing.Pool(len(SIZES)) as pool:
+                pool.starmap(generate_icon, [(img, size) for size in SIZES])
 
     except Exception as e:
         print(f"An error occurred: {e}")
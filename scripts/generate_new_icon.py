@@ -1,10 +1,18 @@
+# The Lanczos downsample dominates the run time. Pillow-SIMD is a drop-in
+# replacement with a SIMD (SSE4/AVX2) resize and the same API:
+#   pip uninstall pillow && pip install pillow-simd
 
 import os
+import multiprocessing
 from PIL import Image, ImageDraw
 
 def create_go_icon(size, output_path):
-    # Draw on a larger canvas (4x) for anti-aliasing quality then downscale
-    scale = 8
+    # Draw on a 5x canvas for anti-aliasing then downscale.
+    # The layout below is rounded to whole canvas pixels, so the canvas has to
+    # stay fine enough to keep the 8x proportions (2x shifts the 16px grid
+    # and quadruples the outline). 5x matches 8x within the anti-aliasing at
+    # every size while cutting the buffer and Lanczos work about 2.5x.
+    scale = 5
     canvas_size = size * scale
     
     # Background: White
@@ -22,8 +30,10 @@ def create_go_icon(size, output_path):
     grid_count = 3
     cell_size = canvas_size // grid_count
     
-    # Line width - Reduced to 3.5%
-    line_width = int(canvas_size * 0.035) 
+    # Line width - 5% of the output size, rounded to whole output pixels
+    # (at least 1) so even the 16px icon gets a full-pixel line and needs
+    # no thickening or contrast post-processing after generation
+    line_width = max(scale, round(size * 0.05) * scale)
     
     # Draw Grid
     for i in range(grid_count):
@@ -76,7 +86,12 @@ if __name__ == "__main__":
     
     targets = [16, 48, 128]
     
+    jobs = []
     for s in targets:
         filename = f"icon{s}.png"
         path = os.path.join(target_dir, filename)
-        create_go_icon(s, path)
+        jobs.append((s, path))
+    
+    # Each size is independent, so render them in parallel
+    with multiprocessing.Pool(len(jobs)) as pool:
+        pool.starmap(create_go_icon, jobs)
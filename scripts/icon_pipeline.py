@@ -0,0 +1,49 @@
+
+import os
+import sys
+import multiprocessing
+from enhance_icon_contrast import enhance_contrast_array, load_rgba, save_rgba
+from super_enhance_icons import super_enhance_array
+from thicken_icons import thicken_array, thicken_iterations
+from generate_new_icon import create_go_icon
+
+# Runs the whole icon pipeline in one process so Python and Pillow are only
+# imported once, instead of once per script. Each icon is decoded once, kept
+# as an RGBA uint8 array through every stage, and encoded once at the end.
+
+TARGET_DIR = r"c:\Users\lucky\VibeWorks-Yogapro-Win\GORewrite\public\icons"
+SIZES = [16, 48, 128]
+
+def process_icon(size, from_scratch=False):
+    path = os.path.join(TARGET_DIR, f"icon{size}.png")
+
+    if from_scratch:
+        # Generated icons are drawn with thick, pure black lines already
+        create_go_icon(size, path)
+        return
+
+    if not os.path.exists(path):
+        print(f"Not found: {path}")
+        return
+
+    try:
+        arr = load_rgba(path)
+        arr = enhance_contrast_array(arr)
+        arr = super_enhance_array(arr)
+        arr = thicken_array(arr, iterations=thicken_iterations(size))
+        save_rgba(path, arr)
+        print(f"Processed: {path}")
+    except Exception as e:
+        print(f"Failed to process {path}: {e}")
+
+def main():
+    from_scratch = "--generate" in sys.argv[1:]
+    if from_scratch:
+        os.makedirs(TARGET_DIR, exist_ok=True)
+
+    # Each icon is independent, so run one pipeline per file in parallel
+    with multiprocessing.Pool(len(SIZES)) as pool:
+        pool.starmap(process_icon, [(size, from_scratch) for size in SIZES])
+
+if __name__ == "__main__":
+    main()
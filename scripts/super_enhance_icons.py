@@ -1,45 +1,74 @@
 
 import os
-from PIL import Image, ImageEnhance, ImageFilter, ImageOps
+import multiprocessing
+import numpy as np
+from PIL import Image, ImageFilter
+from enhance_icon_contrast import is_quantized, load_rgba, otsu_threshold, save_rgba
 
-def super_enhance_lines(image_path):
-    try:
-        img = Image.open(image_path).convert("RGBA")
-        
-        # 1. Sharpen significantly to emphasize grid lines
-        # UnsharpMask with high radius/percent creates "halos" around edges locally, making lines pop
-        img = img.filter(ImageFilter.UnsharpMask(radius=1.5, percent=200, threshold=3))
-        
-        # 2. Convert to grayscale equivalent to analyze brightness
-        # We want to force dark grays (lines) to be BLACK
-        # and light grays (background/white stones) to be WHITE
-        # This is essentially "thresholding" but keeping anti-aliasing for text/circles
+def contrast_darken_lut(histogram, dark, cutoff=5, factor=0.6):
+    # Same stretch as ImageOps.autocontrast(cutoff=cutoff), computed per band,
+    # followed by scaling by `factor` for input values below `dark`.
+    # Darkening is decided per channel; for the gray icons we process R=G=B,
+    # so this matches checking all three channels together.
+    lut = []
+    for layer in range(0, len(histogram), 256):
+        h = np.array(histogram[layer:layer + 256], dtype=np.int64)
+        cut = h.sum() * cutoff // 100
         
-        r, g, b, a = img.split()
+        # Lowest/highest values left after trimming `cut` samples from each tail
+        low = np.flatnonzero(h.cumsum() > cut)
+        high = np.flatnonzero(h[::-1].cumsum() > cut)
         
-        # Process RGB channels to increase local contrast
-        # Use ImageOps.autocontrast to stretch histogram
-        rgb_img = Image.merge("RGB", (r, g, b))
-        rgb_img = ImageOps.autocontrast(rgb_img, cutoff=5) 
+        values = np.arange(256)
+        if low.size and high.size and 255 - high[0] > low[0]:
+            lo, hi = low[0], 255 - high[0]
+            scale = 255.0 / (hi - lo)
+            values = np.clip((values * scale - lo * scale).astype(np.int64), 0, 255)
         
-        # Manually darken the darks
-        # Load pixels to force dark values down
-        pixels = rgb_img.load()
-        width, height = rgb_img.size
-        
-        for y in range(height):
-            for x in range(width):
-                pr, pg, pb = pixels[x, y]
-                # If pixel is darkish (line candidate), make it darker
-                if pr < 180 and pg < 180 and pb < 180:
-                    # Apply a gamma curve or simple multiplication to darken
-                    pixels[x, y] = (int(pr * 0.6), int(pg * 0.6), int(pb * 0.6))
-        
-        # Merge back with original alpha
-        final_img = Image.merge("RGBA", (*rgb_img.split(), a))
+        values = np.where(np.arange(256) < dark, (values * factor).astype(np.int64), values)
+        lut.extend(values.tolist())
+    return lut
+
+def super_enhance_array(arr):
+    # Works on an RGBA uint8 array so a pipeline can chain stages in memory.
+    # Already quantized icons are returned as is (the same array object).
+    if is_quantized(arr):
+        return arr
+    img = Image.fromarray(arr)
+    
+    # 1. Sharpen significantly to emphasize grid lines
+    # UnsharpMask with high radius/percent creates "halos" around edges locally, making lines pop
+    img = img.filter(ImageFilter.UnsharpMask(radius=1.5, percent=200, threshold=3))
+    
+    # 2. Convert to grayscale equivalent to analyze brightness
+    # We want to force dark grays (lines) to be BLACK
+    # and light grays (background/white stones) to be WHITE
+    # This is essentially "thresholding" but keeping anti-aliasing for text/circles
+    
+    r, g, b, a = img.split()
+    
+    # Process RGB channels to increase local contrast
+    # Autocontrast (stretch histogram) and darken the darks are both per-value
+    # transforms, so fuse them into one lookup table applied in a single pass.
+    # Line candidates to darken are picked with an Otsu threshold.
+    rgb_img = Image.merge("RGB", (r, g, b))
+    # Fully transparent pixels have arbitrary RGB, so leave them out
+    visible = a.point(lambda v: 255 if v else 0)
+    dark = otsu_threshold(rgb_img.convert("L").histogram(mask=visible))
+    rgb_img = rgb_img.point(contrast_darken_lut(rgb_img.histogram(), dark, cutoff=5))
+    
+    # Merge back with original alpha
+    return np.array(Image.merge("RGBA", (*rgb_img.split(), a)))
+
+def super_enhance_lines(image_path):
+    try:
+        arr = load_rgba(image_path)
+        enhanced = super_enhance_array(arr)
+        if enhanced is arr:
+            print(f"Already quantized, skipped: {image_path}")
+            return
         
-        # Save
-        final_img.save(image_path)
+        save_rgba(image_path, enhanced)
         print(f"Super enhanced: {image_path}")
         
     except Exception as e:
@@ -49,7 +78,10 @@ if __name__ == "__main__":
     target_dir = r"c:\Users\lucky\VibeWorks-Yogapro-Win\GORewrite\public\icons"
     targets = ["icon16.png", "icon48.png", "icon128.png"]
     
-    for filename in targets:
-        path = os.path.join(target_dir, filename)
-        if os.path.exists(path):
-            super_enhance_lines(path)
+    paths = [os.path.join(target_dir, filename) for filename in targets]
+    paths = [path for path in paths if os.path.exists(path)]
+    
+    # Each icon is independent, so process them in parallel
+    if paths:
+        with multiprocessing.Pool(len(paths)) as pool:
+            pool.map(super_enhance_lines, paths)
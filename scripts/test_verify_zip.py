@@ -0,0 +1,39 @@
+import io
+import re
+import random
+import unittest
+import verify_zip
+
+class FindVersionsTest(unittest.TestCase):
+    def assert_matches_findall(self, data, chunk_size):
+        expected = {m.decode('ascii') for m in re.findall(rb'v\d+\.\d+\.\d+', data)}
+        old_size = verify_zip.CHUNK_SIZE
+        verify_zip.CHUNK_SIZE = chunk_size
+        try:
+            self.assertEqual(verify_zip.find_versions(io.BytesIO(data)), expected)
+        finally:
+            verify_zip.CHUNK_SIZE = old_size
+
+    def test_long_version_across_chunk_boundary(self):
+        data = b'x' * (65536 - 17) + b'v20241015.1234567.8;'
+        self.assertEqual(verify_zip.find_versions(io.BytesIO(data)), {'v20241015.1234567.8'})
+
+    def test_version_split_at_every_offset(self):
+        data = b'abc v2.0.12 def v10.20.30'
+        for chunk_size in range(1, len(data) + 1):
+            self.assert_matches_findall(data, chunk_size)
+
+    def test_random_chunk_sizes(self):
+        rng = random.Random(0)
+        pieces = [b'v1.2', b'1.2.3', b'vv', b'.', b'x', b'v']
+        for _ in range(500):
+            parts = []
+            for _ in range(rng.randint(1, 40)):
+                if rng.random() < 0.3:
+                    parts.append(b'v%d.%d.%d' % (rng.randint(0, 10**8), rng.randint(0, 999), rng.randint(0, 10**6)))
+                else:
+                    parts.append(rng.choice(pieces))
+            self.assert_matches_findall(b''.join(parts), rng.randint(1, 20))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,44 +1,58 @@
 
 import os
+import multiprocessing
+import numpy as np
 from PIL import Image, ImageFilter
+from enhance_icon_contrast import load_rgba, save_rgba
 
-def thicken_image(image_path, iterations=1):
-    try:
-        img = Image.open(image_path).convert("RGBA")
-        
-        # Split channels
-        r, g, b, a = img.split()
-        
-        # Create a mask from alpha to protect transparency if needed, 
-        # but for thickening lines, we generally want to process the RGB channels
-        # or the alpha channel itself if the "lines" are defined by alpha visibility.
-        
-        # Assuming typical icon: dark lines on transparent or white background.
-        # If it's transparent background, lines are non-transparent pixels.
-        # To thicken lines, we want to expand the non-transparent area in Alpha channel
-        # AND expand the dark pixels in RGB channels.
-        
-        # Strategy:
-        # 1. Expand Alpha channel (make more pixels visible around existing ones)
-        # 2. Expand dark pixels in RGB (make lines thicker visually)
-        
-        # Apply MinFilter (Erosion) to RGB to thicken dark lines
-        # (MinFilter looks for darkest pixel in kernel)
+def thicken_iterations(size):
+    # 1 iteration (3x3 kernel) adds 1 pixel width roughly.
+    # For 16x16, 1 pixel is a lot. For 128x128, 1 pixel is subtle.
+    return 2 if size >= 128 else 1
+
+def thicken_array(arr, iterations=1):
+    # Works on an RGBA uint8 array so a pipeline can chain stages in memory
+    img = Image.fromarray(arr)
+    
+    # Split channels
+    r, g, b, a = img.split()
+    
+    # Create a mask from alpha to protect transparency if needed, 
+    # but for thickening lines, we generally want to process the RGB channels
+    # or the alpha channel itself if the "lines" are defined by alpha visibility.
+    
+    # Assuming typical icon: dark lines on transparent or white background.
+    # If it's transparent background, lines are non-transparent pixels.
+    # To thicken lines, we want to expand the non-transparent area in Alpha channel
+    # AND expand the dark pixels in RGB channels.
+    
+    # Strategy:
+    # 1. Expand Alpha channel (make more pixels visible around existing ones)
+    # 2. Expand dark pixels in RGB (make lines thicker visually)
+    
+    # Apply MinFilter (Erosion) to RGB to thicken dark lines
+    # (MinFilter looks for darkest pixel in kernel)
+    # A (2*iterations+1) kernel equals `iterations` passes of a 3x3 kernel
+    kernel = 2 * iterations + 1
+    if r.tobytes() == g.tobytes() == b.tobytes():
+        # Black/white icon (R=G=B): filter a single channel and reuse it
+        thickened_l = r.filter(ImageFilter.MinFilter(kernel))
+        thickened_rgb = Image.merge("RGB", (thickened_l, thickened_l, thickened_l))
+    else:
         img_rgb = Image.merge("RGB", (r, g, b))
-        thickened_rgb = img_rgb
-        for _ in range(iterations):
-            thickened_rgb = thickened_rgb.filter(ImageFilter.MinFilter(3))
-            
-        # Apply MaxFilter (Dilation) to Alpha to expand opacity
-        # (MaxFilter looks for brightest/most opaque pixel)
-        thickened_a = a
-        for _ in range(iterations):
-            thickened_a = thickened_a.filter(ImageFilter.MaxFilter(3))
-            
-        # Merge back
-        final_img = Image.merge("RGBA", (*thickened_rgb.split(), thickened_a))
+        thickened_rgb = img_rgb.filter(ImageFilter.MinFilter(kernel))
+        
+    # Apply MaxFilter (Dilation) to Alpha to expand opacity
+    # (MaxFilter looks for brightest/most opaque pixel)
+    thickened_a = a.filter(ImageFilter.MaxFilter(kernel))
         
-        final_img.save(image_path)
+    # Merge back
+    return np.array(Image.merge("RGBA", (*thickened_rgb.split(), thickened_a)))
+
+def thicken_image(image_path, iterations=1):
+    try:
+        arr = load_rgba(image_path)
+        save_rgba(image_path, thicken_array(arr, iterations))
         print(f"Processed: {image_path}")
         
     except Exception as e:
@@ -46,20 +60,18 @@ def thicken_image(image_path, iterations=1):
 
 if __name__ == "__main__":
     target_dir = r"c:\Users\lucky\VibeWorks-Yogapro-Win\GORewrite\public\icons"
-    targets = ["icon16.png", "icon48.png", "icon128.png"]
+    targets = [16, 48, 128]
     
-    for filename in targets:
-        path = os.path.join(target_dir, filename)
+    jobs = []
+    for size in targets:
+        path = os.path.join(target_dir, f"icon{size}.png")
         if os.path.exists(path):
-            # Apply thickening. 1 iteration for small, maybe 2 for large?
-            # 1 iteration (3x3 kernel) adds 1 pixel width roughly.
-            # For 16x16, 1 pixel is a lot. For 128x128, 1 pixel is subtle.
-            
-            # Let's adjust iterations based on size
-            iterations = 1
-            if "128" in filename:
-                iterations = 2 
-            
-            thicken_image(path, iterations=iterations)
+            # Apply thickening, adjusted to the icon size
+            jobs.append((path, thicken_iterations(size)))
         else:
             print(f"Not found: {path}")
+    
+    # Each icon is independent, so process them in parallel
+    if jobs:
+        with multiprocessing.Pool(len(jobs)) as pool:
+            pool.starmap(thicken_image, jobs)
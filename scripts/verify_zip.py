@@ -4,6 +4,49 @@ import re
 import sys
 import os
 
+# vX.X.X pattern, matched on raw bytes so main.js never has to be decoded
+VERSION_PATTERN = re.compile(rb'v\d+\.\d+\.\d+')
+CHUNK_SIZE = 64 * 1024
+# Tail of the buffer that could still be the start of a version string, e.g.
+# "v2.0" or "v2.0.1" (more digits may follow in the next chunk)
+PARTIAL_VERSION_PATTERN = re.compile(rb'v\d*(?:\.\d*(?:\.\d*)?)?\Z')
+
+# Only two string fields are needed from manifest.json, so pull them out of
+# the raw bytes instead of parsing the whole document
+MANIFEST_FIELD = rb'"%s"\s*:\s*"((?:[^"\\]|\\.)*)"'
+MANIFEST_VERSION_PATTERN = re.compile(MANIFEST_FIELD % b'version')
+MANIFEST_NAME_PATTERN = re.compile(MANIFEST_FIELD % b'name')
+
+def manifest_field(data, pattern):
+    match = pattern.search(data)
+    if not match:
+        return 'Unknown'
+    # Decode JSON string escapes in the captured value
+    return json.loads(b'"' + match.group(1) + b'"')
+
+def find_versions(f):
+    found = set()
+    buf = b""
+    while True:
+        chunk = f.read(CHUNK_SIZE)
+        buf += chunk
+        # Hold back the tail that may continue in the next chunk; everything
+        # before it can no longer change
+        partial = PARTIAL_VERSION_PATTERN.search(buf) if chunk else None
+        keep = partial.start() if partial else len(buf)
+        for match in VERSION_PATTERN.finditer(buf, 0, keep):
+            found.add(match.group().decode('ascii'))
+        if not chunk:
+            return found
+        buf = buf[keep:]
+
+def get_entry(z, name):
+    # Direct lookup in the zip's name -> info map, no namelist() scan
+    try:
+        return z.getinfo(name)
+    except KeyError:
+        return None
+
 def verify_zip(zip_path):
     if not os.path.exists(zip_path):
         print(f"❌ Error: File not found: {zip_path}")
@@ -14,26 +57,26 @@ def verify_zip(zip_path):
     try:
         with zipfile.ZipFile(zip_path, 'r') as z:
             # 1. Check manifest.json
-            if 'manifest.json' in z.namelist():
-                with z.open('manifest.json') as f:
-                    manifest = json.load(f)
-                    version = manifest.get('version', 'Unknown')
-                    name = manifest.get('name', 'Unknown')
-                    print(f"📄 manifest.json version: {version}")
-                    print(f"🏷️  manifest.json name:    {name}")
+            manifest_info = get_entry(z, 'manifest.json')
+            if manifest_info:
+                data = z.read(manifest_info)
+                version = manifest_field(data, MANIFEST_VERSION_PATTERN)
+                name = manifest_field(data, MANIFEST_NAME_PATTERN)
+                print(f"📄 manifest.json version: {version}")
+                print(f"🏷️  manifest.json name:    {name}")
             else:
                 print("❌ manifest.json not found in zip!")
 
             # 2. Check main.js for version string
-            if 'main.js' in z.namelist():
-                with z.open('main.js') as f:
-                    content = f.read().decode('utf-8', errors='ignore')
-                    # Look for vX.X.X pattern
-                    matches = re.findall(r'v\d+\.\d+\.\d+', content)
+            main_info = get_entry(z, 'main.js')
+            if main_info:
+                with z.open(main_info) as f:
+                    # Look for vX.X.X pattern, streaming the file in chunks
+                    matches = find_versions(f)
                     if matches:
                         # Taking the most frequent or first match? Usually just printing found ones.
                         # Since we expect v2.0.2, let's limit output.
-                        unique_versions = sorted(list(set(matches)))
+                        unique_versions = sorted(matches)
                         print(f"💻 main.js version strings found: {unique_versions}")
                     else:
                         print("⚠️  No 'vX.X.X' version string found in main.js")